@@ -1,6 +1,27 @@
 
 import streamlit as st
-import pandas as pd
+
+from nephrolist_core import (
+    encode_csv,
+    encode_parquet,
+    extract_data_from_pdf,
+    file_key,
+)
+
+
+@st.cache_data(show_spinner=False)
+def build_outputs(key: str, _file_bytes: bytes) -> tuple[dict, bytes, bytes]:
+    """Extract the clinical record and its CSV/Parquet bytes, cached across reruns.
+
+    Only ``key`` (see ``file_key``) is hashed by Streamlit; the leading
+    underscore keeps the raw file bytes out of the cache key.
+    """
+    dados = extract_data_from_pdf(_file_bytes)
+    csv_bytes = encode_csv(dados)
+    # O Parquet é gerado junto com o CSV, uma vez por arquivo, mesmo que só o CSV
+    # seja baixado: para um único registro o custo é desprezível
+    return dados, csv_bytes, encode_parquet([dados])
+
 
 st.set_page_config(page_title="Leitor de PDFs - NephroList", layout="centered")
 
@@ -9,30 +30,19 @@ st.markdown("Envie um PDF gerado pelo prontuário eletrônico para extrair dados
 
 uploaded_file = st.file_uploader("Escolha um arquivo PDF", type=["pdf"])
 
+# Processa cada upload uma única vez; reruns de outros widgets reutilizam o session_state
+if uploaded_file and st.session_state.get("file_id") != uploaded_file.file_id:
+    key = file_key(uploaded_file.getbuffer())
+    st.session_state["outputs"] = build_outputs(key, uploaded_file.getvalue())
+    st.session_state["file_id"] = uploaded_file.file_id
+
 if uploaded_file:
-    # Simulação de extração (dados fixos para exemplo)
-    dados = {
-        "Nome": "Vera Ondina Marcos",
-        "Setor": "CTG 4",
-        "Leito": "19",
-        "Idade": "82",
-        "Data_Admissao": "2025-06-23",
-        "Motivo_Internacao": "Febre e tremores em paciente dialítica",
-        "Diagnostico": "Infecção de cateter de hemodiálise",
-        "Situacao_Atual": "Afebril, vertigem postural, PA 90x60",
-        "Dialise": "Sim / Crônico",
-        "Peso": "65",
-        "Plano": "Suspender Anlodipino e Furosemida. HD + ATB guiado por vancocinemia.",
-        "Preceptor": "Gabriel Silqueira",
-        "Residente": "Marcela Oliveira",
-        "Desfecho": "Alta",
-        "Data_Desfecho": "2025-06-28"
-    }
-
-    df = pd.DataFrame([dados])
+    dados, csv_bytes, parquet_bytes = st.session_state["outputs"]
     st.success("✅ Dados extraídos com sucesso!")
-    st.dataframe(df)
-
-    csv = df.to_csv(index=False).encode('utf-8')
-    st.download_button("⬇️ Baixar dados como CSV", csv, "dados_extraidos_nephrolist.csv", "text/csv")
+    # Um único registro é exibido como tabela estática campo/valor (2×15), em vez da
+    # grade interativa do st.dataframe. O script não importa o pandas, mas o st.table
+    # ainda o carrega internamente ao renderizar
+    st.table([{"Campo": campo, "Valor": valor} for campo, valor in dados.items()])
 
+    st.download_button("⬇️ Baixar dados como CSV", csv_bytes, "dados_extraidos_nephrolist.csv", "text/csv")
+    st.download_button("⬇️ Baixar dados como Parquet", parquet_bytes, "dados_extraidos_nephrolist.parquet", "application/octet-stream")
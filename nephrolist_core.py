@@ -0,0 +1,62 @@
+"""
+Core extraction and export functions for the NephroList PDF App.
+
+Kept free of Streamlit so they can be imported and tested directly.
+"""
+import csv
+import hashlib
+import io
+
+
+# Simulação de extração (dados fixos para exemplo). O CSV não é pré-calculado na
+# importação: o app já o gera uma única vez por arquivo (st.cache_data + session_state)
+DADOS = {
+    "Nome": "Vera Ondina Marcos",
+    "Setor": "CTG 4",
+    "Leito": "19",
+    "Idade": "82",
+    "Data_Admissao": "2025-06-23",
+    "Motivo_Internacao": "Febre e tremores em paciente dialítica",
+    "Diagnostico": "Infecção de cateter de hemodiálise",
+    "Situacao_Atual": "Afebril, vertigem postural, PA 90x60",
+    "Dialise": "Sim / Crônico",
+    "Peso": "65",
+    "Plano": "Suspender Anlodipino e Furosemida. HD + ATB guiado por vancocinemia.",
+    "Preceptor": "Gabriel Silqueira",
+    "Residente": "Marcela Oliveira",
+    "Desfecho": "Alta",
+    "Data_Desfecho": "2025-06-28"
+}
+
+
+def encode_csv(dados: dict) -> bytes:
+    """Encode a single clinical record as UTF-8 CSV bytes (header + one row)."""
+    # Codifica direto para bytes, sem materializar a string intermediária
+    buf = io.BytesIO()
+    with io.TextIOWrapper(buf, encoding='utf-8', newline='', write_through=True) as text:
+        writer = csv.writer(text, quoting=csv.QUOTE_MINIMAL, lineterminator="\n")
+        writer.writerow(dados.keys())
+        writer.writerow(dados.values())
+        return buf.getvalue()
+
+
+def encode_parquet(registros: list[dict]) -> bytes:
+    """Encode clinical records as zstd-compressed Parquet bytes."""
+    # Importado sob demanda para não pesar na inicialização do app
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    buf = io.BytesIO()
+    pq.write_table(pa.Table.from_pylist(registros), buf, compression='zstd')
+    return buf.getvalue()
+
+
+def extract_data_from_pdf(file_bytes: bytes) -> dict:
+    """Extract clinical data from PDF file."""
+    # Cópia, para que quem alterar o resultado não modifique os dados de exemplo
+    return dict(DADOS)
+
+
+def file_key(file_buffer: bytes | memoryview) -> str:
+    """Return a short blake2b digest of the uploaded file content."""
+    return hashlib.blake2b(file_buffer, digest_size=16).hexdigest()
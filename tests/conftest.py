@@ -6,9 +6,12 @@ import pandas as pd
 from io import BytesIO
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_clinical_data():
-    """Sample clinical data matching expected extraction format."""
+    """Sample clinical data matching expected extraction format.
+
+    Session-scoped: tests that modify it must work on a ``.copy()``.
+    """
     return {
         "Nome": "Vera Ondina Marcos",
         "Setor": "CTG 4",
@@ -50,10 +53,15 @@ def sample_clinical_data_missing_fields():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_dataframe(sample_clinical_data):
-    """Sample DataFrame created from clinical data."""
-    return pd.DataFrame([sample_clinical_data])
+    """Sample DataFrame created from clinical data.
+
+    Session-scoped: tests that modify it must work on a ``.copy()``.
+    """
+    # All fields are text: an explicit "string" dtype skips inference and gives the
+    # same columns on pandas 2.x and 3.x, whose defaults differ (object vs str)
+    return pd.DataFrame([sample_clinical_data], dtype="string")
 
 
 @pytest.fixture
@@ -8,6 +8,8 @@ The examples below show the intended test structure.
 """
 import pytest
 
+pytestmark = pytest.mark.integration
+
 
 class TestStreamlitApp:
     """Test suite for Streamlit application integration."""
@@ -3,10 +3,26 @@ Unit tests for clinical data validation.
 
 These tests verify that extracted data meets expected formats and constraints.
 """
+import re
 import pytest
 from datetime import datetime
 
 
+# YYYY-MM-DD with month 01-12 and day 01-31. This only checks the shape:
+# dates such as 2025-02-31 still need strptime to be rejected
+_DATE_RE = re.compile(r"^\d{4}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])$")
+
+INVALID_AGES = ["-5", "200", "abc", ""]
+
+INVALID_DATES = [
+    "2025-13-01",  # Invalid month
+    "2025-06-32",  # Invalid day
+    "25-06-2025",  # Wrong format
+    "2025/06/25",  # Wrong separator
+    "invalid",     # Not a date
+]
+
+
 # NOTE: These tests assume functions will be extracted from the main script
 # Currently, the validation logic needs to be implemented
 
@@ -31,11 +47,13 @@ class TestDataValidation:
         for field in date_fields:
             if field in sample_clinical_data and sample_clinical_data[field]:
                 date_str = sample_clinical_data[field]
-                # Should be able to parse as date
+                assert _DATE_RE.match(date_str), \
+                    f"Invalid date format for {field}: {date_str}"
+                # The regex accepts impossible dates (e.g. 2025-02-31)
                 try:
                     datetime.strptime(date_str, "%Y-%m-%d")
                 except ValueError:
-                    pytest.fail(f"Invalid date format for {field}: {date_str}")
+                    pytest.fail(f"Invalid date for {field}: {date_str}")
 
     def test_validate_age_is_numeric(self, sample_clinical_data):
         """Test that age field contains a valid number."""
@@ -91,32 +109,21 @@ class TestDataValidation:
             value = sample_clinical_data_missing_fields.get(field, None)
             assert value is None or isinstance(value, str)
 
-    @pytest.mark.parametrize("invalid_age", ["-5", "200", "abc", ""])
-    def test_reject_invalid_ages(self, invalid_age, sample_clinical_data):
+    def test_reject_invalid_ages(self):
         """Test that invalid age values are rejected."""
-        sample_clinical_data["Idade"] = invalid_age
-
-        # Validation should fail for these cases
-        if invalid_age == "" or not invalid_age.isdigit():
-            with pytest.raises((ValueError, AssertionError)):
-                assert invalid_age.isdigit()
-        elif int(invalid_age) < 0 or int(invalid_age) > 150:
-            with pytest.raises((ValueError, AssertionError)):
-                assert 0 <= int(invalid_age) <= 150
-
-    @pytest.mark.parametrize("invalid_date", [
-        "2025-13-01",  # Invalid month
-        "2025-06-32",  # Invalid day
-        "25-06-2025",  # Wrong format
-        "2025/06/25",  # Wrong separator
-        "invalid",     # Not a date
-    ])
-    def test_reject_invalid_dates(self, invalid_date, sample_clinical_data):
+        for invalid_age in INVALID_AGES:
+            try:
+                age = int(invalid_age)
+            except ValueError:
+                continue
+            if invalid_age.isdigit() and 0 <= age <= 150:
+                pytest.fail(f"Age should be rejected, got: {invalid_age!r}")
+
+    def test_reject_invalid_dates(self):
         """Test that invalid date formats are rejected."""
-        sample_clinical_data["Data_Admissao"] = invalid_date
-
-        with pytest.raises(ValueError):
-            datetime.strptime(invalid_date, "%Y-%m-%d")
+        for invalid_date in INVALID_DATES:
+            assert not _DATE_RE.match(invalid_date), \
+                f"Date should be rejected, got: {invalid_date!r}"
 
     def test_validate_special_characters_in_text_fields(self, sample_clinical_data):
         """Test that text fields properly handle special characters."""
@@ -126,7 +133,7 @@ class TestDataValidation:
         special_chars_data["Diagnostico"] = "Infecção: observação crítica"
 
         # Should not raise any encoding errors
-        for key, value in special_chars_data.items():
-            assert isinstance(value, str)
-            # Ensure UTF-8 can encode it
-            value.encode('utf-8')
+        values = special_chars_data.values()
+        assert all(isinstance(value, str) for value in values)
+        # Ensure UTF-8 can encode it (a single codec call over all fields)
+        "\x00".join(values).encode('utf-8')
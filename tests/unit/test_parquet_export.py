@@ -0,0 +1,40 @@
+"""
+Unit tests for Parquet export functionality.
+
+These tests verify that clinical records survive a Parquet round-trip.
+"""
+import pytest
+from io import BytesIO
+
+from nephrolist_core import encode_parquet
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+class TestParquetExport:
+    """Test suite for Parquet export functionality."""
+
+    def test_parquet_round_trip(self, sample_clinical_data):
+        """Test that a record is read back with same columns, order and values."""
+        table = pq.read_table(BytesIO(encode_parquet([sample_clinical_data])))
+
+        assert table.num_rows == 1
+        assert table.column_names == list(sample_clinical_data.keys())
+        assert table.to_pylist() == [sample_clinical_data]
+
+    def test_parquet_preserves_special_characters(self):
+        """Test that Portuguese characters, quotes and newlines are preserved."""
+        data = {
+            "Nome": 'José "Zé" Gonçalves',
+            "Plano": "Linha 1\nLinha 2, situação crítica"
+        }
+        table = pq.read_table(BytesIO(encode_parquet([data])))
+
+        assert table.to_pylist() == [data]
+
+    def test_parquet_bytes_encoding(self, sample_clinical_data):
+        """Test that Parquet output is non-empty bytes with the Parquet magic."""
+        parquet_bytes = encode_parquet([sample_clinical_data])
+
+        assert isinstance(parquet_bytes, bytes)
+        assert parquet_bytes[:4] == b"PAR1"